@@ -12,12 +12,15 @@ import six
 ORBITALS = ("s", "p", "d", "f", "g", "h", "i", "j", "k")
 SHELLS = ("K", "L", "M", "N", "O", "P", "Q")
 
+_ORBITAL_INDEX = {o: l for l, o in enumerate(ORBITALS)}
+
 
 def get_l(subshell: str) -> int:
     "Return the orbital angular momentum quantum number for a given subshell"
 
-    if subshell.lower() in ORBITALS:
-        return ORBITALS.index(subshell.lower())
+    l = _ORBITAL_INDEX.get(subshell.lower())
+    if l is not None:
+        return l
     else:
         raise ValueError(
             (
@@ -27,6 +30,16 @@ def get_l(subshell: str) -> int:
         )
 
 
+def _aufbau_key(shell: Tuple[Tuple[int, str], int]) -> Tuple[int, int]:
+    "Sorting key for `((n, orbital), occupation)` items, by `n + l` and then `n`"
+    (n, o), _ = shell
+    l = _ORBITAL_INDEX.get(o)
+    if l is None:
+        # upper case or invalid labels
+        l = get_l(o)
+    return n + l, n
+
+
 def subshell_degeneracy(subshell: str) -> int:
     "Return the degeneracy of a given subshell"
     return 2 * get_l(subshell) + 1
@@ -66,6 +79,49 @@ def shell_capactity(shell: str) -> int:
         )
 
 
+def _parse_shell(token: str) -> Union[Tuple[int, str, int], None]:
+    """
+    Split a shell token like ``3d10`` into a ``(n, orbital, electrons)``
+    tuple, the number of electrons defaults to 1 when omitted. Return `None`
+    if the token is not a valid shell.
+    """
+    if len(token) < 2 or not token[0].isdecimal() or token[1] not in ORBITALS:
+        return None
+    if len(token) == 2:
+        return int(token[0]), token[1], 1
+    if not token[2:].isdecimal():
+        return None
+    return int(token[0]), token[1], int(token[2:])
+
+
+def _slater_screening_dict(conf, n, o, ne, coeff):
+    """
+    Slater screening constant for the `(n, o)` subshell computed from the
+    configuration `OrderedDict`.
+    """
+    vale = n1 = n2 = 0.0
+    if o in {"s", "p"}:
+        for (kn, ko), v in conf.items():
+            if kn == n:
+                if ko in {"s", "p"}:
+                    vale += v
+            elif kn == n - 1:
+                n1 += v * 0.85
+            elif 1 <= kn < n - 1:
+                n2 += v
+    else:
+        for (kn, ko), v in conf.items():
+            if kn == n:
+                if ko == o:
+                    vale += v
+                else:
+                    n1 += v
+            elif 1 <= kn < n:
+                n2 += v
+    # number of valence electrons - 1
+    return n1 + n2 + (vale - ne) * coeff
+
+
 class ElectronicConfiguration(object):
     """Electronic configuration handler"""
 
@@ -80,6 +136,10 @@ class ElectronicConfiguration(object):
         ]
     )
 
+    # default patterns, custom ones passed to the constructor are stored per instance
+    _ATOMRE = re.compile(r"\[([A-Z][a-z]*)\]")
+    _SHELLRE = re.compile(r"(?P<n>\d)(?P<o>[spdfghijk])(?P<e>\d+)?")
+
     def __init__(
         self, conf: Union[str, Dict] = None, atomre: str = None, shellre: str = None
     ):
@@ -99,37 +159,42 @@ class ElectronicConfiguration(object):
             self.confstr = value
             self.parse(str(value))
         elif isinstance(value, dict):
-            self._conf = OrderedDict(
-                sorted(value.items(), key=lambda x: (x[0][0] + get_l(x[0][1]), x[0][0]))
-            )
+            self._conf = OrderedDict(sorted(value.items(), key=_aufbau_key))
         else:
             raise ValueError(f"<conf> should be str or dict, got {type(value)}")
 
     @property
     def atomre(self) -> Pattern:
         "Regular expression for atomic symbols"
+        if self._atomre is None:
+            return ElectronicConfiguration._ATOMRE
         return self._atomre
 
     @atomre.setter
     def atomre(self, value: str) -> None:
 
-        if value is None:
-            self._atomre = re.compile(r"\[([A-Z][a-z]*)\]")
-        else:
-            self._atomre = re.compile(value)
+        self._atomre = None if value is None else re.compile(value)
 
     @property
     def shellre(self) -> Pattern:
         "Regular expression for the shell"
+        if self._shellre is None:
+            return ElectronicConfiguration._SHELLRE
         return self._shellre
 
     @shellre.setter
     def shellre(self, value: str) -> None:
 
-        if value is None:
-            self._shellre = re.compile(r"(?P<n>\d)(?P<o>[spdfghijk])(?P<e>\d+)?")
-        else:
-            self._shellre = re.compile(value)
+        # with the default pattern the shells are parsed by `_parse_shell`
+        self._shellre = None if value is None else re.compile(value)
+
+    def _match_shell(self, token: str) -> Union[Tuple[int, str, int], None]:
+        "Parse a shell token with the custom `shellre` pattern"
+        match = self._shellre.match(token)
+        if match is None:
+            return None
+        n, o, e = match.group("n", "o", "e")
+        return int(n), o, (int(e) if e is not None else 1)
 
     def parse(self, string: str) -> None:
         """
@@ -140,28 +205,22 @@ class ElectronicConfiguration(object):
         core = {}
         citems = string.split()
 
-        if self.atomre.match(citems[0]):
-            symbol = str(self.atomre.match(citems[0]).group(1))
+        match = self.atomre.match(citems[0])
+        if match:
+            symbol = str(match.group(1))
             citems = citems[1:]
-            core = [
-                self.shellre.match(o).group("n", "o", "e")
-                for o in ElectronicConfiguration.noble[symbol].split()
-                if self.shellre.match(o)
-            ]
-            core = OrderedDict(
-                [((int(n), o), (int(e) if e is not None else 1)) for (n, o, e) in core]
-            )
+            core = _NOBLE_CORES[symbol]
 
-        valence = [
-            self.shellre.match(o).group("n", "o", "e")
-            for o in citems
-            if self.shellre.match(o)
-        ]
-        valence = OrderedDict(
-            [((int(n), o), (int(e) if e is not None else 1)) for (n, o, e) in valence]
-        )
+        parse_shell = _parse_shell if self._shellre is None else self._match_shell
+        valence = OrderedDict()
+        for token in citems:
+            shell = parse_shell(token)
+            if shell is not None:
+                n, o, e = shell
+                valence[(n, o)] = e
 
-        self._conf = OrderedDict(list(core.items()) + list(valence.items()))
+        self._conf = OrderedDict(core)
+        self._conf.update(valence)
 
     def get_largest_core(self) -> Tuple:
         """
@@ -171,11 +230,9 @@ class ElectronicConfiguration(object):
         """
         confset = set(self.conf.items())
         for s, conf in reversed(ElectronicConfiguration.noble.items()):
-            ec = ElectronicConfiguration(conf)
-            nobleset = set(ec.conf.items())
-            ans = confset.issuperset(nobleset)
-            if ans:
-                return (s, ec)
+            nobleset = set(_NOBLE_CORES[s].items())
+            if confset.issuperset(nobleset):
+                return (s, ElectronicConfiguration(conf))
 
     def get_valence(self):
         """
@@ -188,33 +245,26 @@ class ElectronicConfiguration(object):
 
     def sort(self, inplace: bool = True):
         "Sort the occupations OD"
+        conf = OrderedDict(sorted(self.conf.items(), key=_aufbau_key))
         if inplace:
-            self.conf = OrderedDict(
-                sorted(
-                    self.conf.items(), key=lambda x: (x[0][0] + get_l(x[0][1]), x[0][0])
-                )
-            )
+            self._conf = conf
         else:
-            return OrderedDict(
-                sorted(
-                    self.conf.items(), key=lambda x: (x[0][0] + get_l(x[0][1]), x[0][0])
-                )
-            )
+            return conf
 
     def electrons_per_shell(self) -> Dict[str, int]:
         "Return number of electrons per shell as dict"
-        return {
-            s: sum(v for k, v in self.conf.items() if k[0] == n)
-            for n, s in zip(range(1, self.max_n() + 1), SHELLS)
-        }
+        ne = [0] * (self.max_n() + 1)
+        for (n, _), v in self.conf.items():
+            ne[n] += v
+        return dict(zip(SHELLS, ne[1:]))
 
     def shell2int(self) -> List[Tuple[int]]:
         "configuration as list of tuples (n, l, e)"
-        return [(x[0], get_l(x[1]), x[2]) for x in self.conf]
+        return [(n, get_l(o), e) for (n, o), e in self.conf.items()]
 
     def max_n(self) -> int:
         "Return the largest value of principal quantum number for the atom"
-        return max(shell[0] for shell in self.conf.keys())
+        return max(n for n, _ in self.conf.keys())
 
     def max_l(self, n: int) -> int:
         """
@@ -229,23 +279,22 @@ class ElectronicConfiguration(object):
             l: int
                 Azimutal quantum number
         """
-        return ORBITALS[max(get_l(x[1]) for x in self.conf.keys() if x[0] == n)]
+        return ORBITALS[max(get_l(o) for shell, o in self.conf.keys() if shell == n)]
 
     def last_subshell(self, wrt: str = "order"):
         "Return the valence shell"
         if wrt.lower() == "order":
             return list(self.conf.items())[-1]
         elif wrt.lower() == "aufbau":
-            return sorted(
-                self.conf.items(), key=lambda x: (x[0][0] + get_l(x[0][1]), x[0][0])
-            )[-1]
+            return max(self.conf.items(), key=_aufbau_key)
         else:
             raise ValueError(f"wrong <wrt>: {wrt}")
 
     def nvalence(self, block: str, period: int, method: str = None) -> int:
         "Return the number of valence electrons"
         if block in {"s", "p"}:
-            return sum(v for k, v in self.conf.items() if k[0] == self.max_n())
+            max_n = self.max_n()
+            return sum(v for (n, _), v in self.conf.items() if n == max_n)
         elif block == "d":
             if method == "simple":
                 return 2
@@ -345,30 +394,12 @@ class ElectronicConfiguration(object):
             an extra electron
         """
 
-        ne = 0 if alle else 1
-        coeff = 0.3 if n == 1 else 0.35
-        if o in {"s", "p"}:
-            # get the number of valence electrons - 1
-            vale = float(
-                sum(v for k, v in self.conf.items() if k[0] == n and k[1] in ["s", "p"])
-                - ne
-            )
-            n1 = sum(v * 0.85 for k, v in self.conf.items() if k[0] == n - 1)
-            n2 = sum(float(v) for k, v in self.conf.items() if k[0] in range(1, n - 1))
-
-        elif o in {"d", "f"}:
-            # get the number of valence electrons - 1
-            vale = float(
-                sum(v for k, v in self.conf.items() if k[0] == n and k[1] == o) - ne
-            )
-
-            n1 = sum(float(v) for k, v in self.conf.items() if k[0] == n and k[1] != o)
-            n2 = sum(float(v) for k, v in self.conf.items() if k[0] in range(1, n))
-
-        else:
+        if o not in {"s", "p", "d", "f"}:
             raise ValueError("wrong valence subshell: ", o)
 
-        return n1 + n2 + vale * coeff
+        ne = 0 if alle else 1
+        coeff = 0.3 if n == 1 else 0.35
+        return _slater_screening_dict(self.conf, n, o, ne, coeff)
 
     def to_str(self) -> str:
         "Return a string with the configuration"
@@ -382,6 +413,20 @@ class ElectronicConfiguration(object):
     def __str__(self) -> str:
         return self.to_str()
 
+    def copy(self) -> "ElectronicConfiguration":
+        "Return a copy of the configuration with its own `conf`"
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new._conf = OrderedDict(self._conf)
+        return new
+
+
+# noble gas cores parsed once and keyed by the symbol of the noble gas
+_NOBLE_CORES = {
+    symbol: ElectronicConfiguration(conf).conf
+    for symbol, conf in ElectronicConfiguration.noble.items()
+}
+
 
 def get_spin_strings(sodict, average: bool = True):
     """
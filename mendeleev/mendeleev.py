@@ -5,7 +5,7 @@ from typing import List, Union
 import six
 
 from .db import get_session
-from .models import Element, Isotope
+from .models import Element, Isotope, get_elements
 
 
 __all__ = [
@@ -91,7 +91,7 @@ def get_all_elements() -> List[Element]:
     "Get all elements as a list"
 
     session = get_session()
-    elements = session.query(Element).all()
+    elements = get_elements(session)
     session.close()
     return elements
 
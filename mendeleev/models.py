@@ -3,16 +3,35 @@
 """module specifying the database models"""
 
 from typing import Any, Callable, Dict, List, Tuple, Union
+from functools import cached_property, lru_cache
 from operator import attrgetter
 import math
 import urllib.parse
 
 import numpy as np
-from sqlalchemy import Column, Boolean, Integer, String, Float, ForeignKey
-from sqlalchemy.orm import relationship, reconstructor
+from sqlalchemy import (
+    Column,
+    Boolean,
+    Integer,
+    String,
+    Float,
+    ForeignKey,
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy.orm import (
+    Session,
+    joinedload,
+    load_only,
+    raiseload,
+    reconstructor,
+    relationship,
+    selectinload,
+)
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.hybrid import hybrid_property, hybrid_method
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from .electronegativity import (
     allred_rochow,
@@ -25,7 +44,7 @@ from .electronegativity import (
     sanderson,
 )
 from .db import get_session
-from .econf import ElectronicConfiguration, get_l, ORBITALS
+from .econf import ElectronicConfiguration, ORBITALS
 from .utils import coeffs
 
 
@@ -43,6 +62,20 @@ __all__ = [
 Base = declarative_base()
 
 
+@lru_cache(maxsize=None)
+def _repr_keys(cls) -> Tuple[str, ...]:
+    "Sorted names of the public column attributes of a model"
+    return tuple(
+        sorted(
+            key for key in inspect(cls).column_attrs.keys() if not key.startswith("_")
+        )
+    )
+
+
+# parsed electronic configurations keyed by the `econf` string
+_EC_CACHE: Dict[str, ElectronicConfiguration] = {}
+
+
 class Element(Base):
     """
     Chemical element.
@@ -183,7 +216,7 @@ class Element(Base):
     glawe_number = Column(Integer)
     goldschmidt_class = Column(String)
     group_id = Column(Integer, ForeignKey("groups.group_id"))
-    group = relationship("Group", uselist=False, lazy="subquery")
+    group = relationship("Group", uselist=False, lazy="joined")
     heat_of_formation = Column(Float)
     is_monoisotopic = Column(Boolean)
     is_radioactive = Column(Boolean)
@@ -217,26 +250,34 @@ class Element(Base):
     vdw_radius_uff = Column(Float)
     vdw_radius_mm3 = Column(Float)
 
-    _ionization_energies = relationship("IonizationEnergy", lazy="subquery")
-    _oxidation_states = relationship("OxidationState", lazy="subquery")
-    _series = relationship("Series", uselist=False, lazy="subquery")
+    _ionization_energies = relationship("IonizationEnergy", lazy="selectin")
+    _oxidation_states = relationship("OxidationState", lazy="selectin")
+    _series = relationship("Series", uselist=False, lazy="joined")
 
-    ionic_radii = relationship("IonicRadius", lazy="subquery")
-    isotopes = relationship("Isotope", lazy="subquery", back_populates="element")
-    phase_transitions = relationship("PhaseTransition", lazy="subquery")
-    screening_constants = relationship("ScreeningConstant", lazy="subquery")
+    ionic_radii = relationship("IonicRadius", lazy="selectin")
+    isotopes = relationship("Isotope", lazy="selectin", back_populates="element")
+    phase_transitions = relationship("PhaseTransition", lazy="selectin")
+    screening_constants = relationship("ScreeningConstant", lazy="selectin")
 
     @reconstructor
     def init_on_load(self) -> None:
-        "Initialize the ElectronicConfiguration class as attribute of self"
-        self.ec = ElectronicConfiguration(self.econf)
+        """
+        Initialize the ElectronicConfiguration class as attribute of self
+
+        The configuration is parsed once per unique `econf` string and each
+        instance gets its own copy of the parsed configuration.
+        """
+        ec = _EC_CACHE.get(self.econf)
+        if ec is None:
+            ec = _EC_CACHE[self.econf] = ElectronicConfiguration(self.econf)
+        self.ec = ec.copy()
 
     @hybrid_property
     def specific_heat(self) -> float:
         """Alias for `specific_heat_capacity` for backwards compatibility"""
         return self.specific_heat_capacity
 
-    @hybrid_property
+    @cached_property
     def ionenergies(self) -> Dict[int, float]:
         """
         Return a dict with ionization degree as keys and ionization energies
@@ -244,12 +285,12 @@ class Element(Base):
         """
         return {ie.degree: ie.energy for ie in self._ionization_energies}
 
-    @hybrid_property
+    @cached_property
     def oxistates(self) -> List[int]:
         """Return the main oxidation states as a list of integers"""
         return self.oxidation_states()
 
-    @hybrid_property
+    @cached_property
     def sconst(self) -> Dict[Tuple[int, int], float]:
         """
         Return a dict with screening constants with tuples (n, s) as keys and
@@ -286,12 +327,12 @@ class Element(Base):
         nist_root_url = "https://webbook.nist.gov/cgi/inchi/"
         return nist_root_url + urllib.parse.quote(self.inchi)
 
-    @hybrid_property
+    @property
     def electrons(self) -> int:
         """Return the number of electrons."""
         return self.atomic_number
 
-    @hybrid_property
+    @property
     def neutrons(self) -> int:
         """
         Return the number of neutrons of the most abundant natural stable
@@ -299,7 +340,7 @@ class Element(Base):
         """
         return self.mass_number - self.protons
 
-    @hybrid_property
+    @property
     def protons(self) -> int:
         """Return the number of protons."""
         return self.atomic_number
@@ -311,7 +352,7 @@ class Element(Base):
         """
         return self.atomic_weight
 
-    @hybrid_property
+    @cached_property
     def mass_number(self) -> int:
         """
         Return the mass number of the most abundant natural stable isotope
@@ -325,6 +366,29 @@ class Element(Base):
         else:
             return self.isotopes[0].mass_number
 
+    @classmethod
+    def mass_number_for(cls, session: Session, z: int) -> int:
+        """
+        Return the mass number of the most abundant natural stable isotope
+        of the element with atomic number `z` without loading its isotopes.
+
+        Args:
+            session: database session
+            z: atomic number
+        """
+        mass_number = session.scalar(
+            select(Isotope.mass_number)
+            .where(Isotope.atomic_number == z)
+            .order_by(Isotope.abundance.desc().nulls_last(), Isotope.id)
+            .limit(1)
+        )
+        if mass_number is None:
+            atomic_weight = session.scalar(
+                select(cls.atomic_weight).where(cls.atomic_number == z)
+            )
+            return int(atomic_weight)
+        return mass_number
+
     def mass_str(self) -> str:
         """String representation of atomic weight"""
 
@@ -348,7 +412,6 @@ class Element(Base):
         """
         return self.covalent_radius_pyykko
 
-    @hybrid_method
     def hardness(self, charge: int = 0) -> Union[float, None]:
         r"""
         Return the absolute hardness, calculated as
@@ -368,25 +431,19 @@ class Element(Base):
 
         """
         if charge == 0:
-            if (
-                self.ionenergies.get(1, None) is not None
-                and self.electron_affinity is not None
-            ):
-                return (self.ionenergies[1] - self.electron_affinity) * 0.5
-            else:
-                return None
+            ip = self.ionenergies.get(1, None)
+            ea = self.electron_affinity
         elif charge > 0:
-            if (
-                self.ionenergies.get(charge + 1, None) is not None
-                and self.ionenergies.get(charge, None) is not None
-            ):
-                return (self.ionenergies[charge + 1] - self.ionenergies[charge]) * 0.5
-            else:
-                return None
-        elif charge < 0:
+            ip = self.ionenergies.get(charge + 1, None)
+            ea = self.ionenergies.get(charge, None)
+        else:
             raise ValueError(f"Charge has to be a non-negative integer, got: {charge}")
 
-    @hybrid_method
+        if ip is not None and ea is not None:
+            return (ip - ea) * 0.5
+        else:
+            return None
+
     def softness(self, charge: int = 0) -> Union[float, None]:
         r"""
         Return the absolute softness.
@@ -467,7 +524,7 @@ class Element(Base):
 
         if o is None:
             # take the shell with max `l` for a given `n`
-            o = ORBITALS[max(get_l(x[1]) for x in self.ec.conf.keys() if x[0] == n)]
+            o = self.ec.max_l(n)
         elif o not in ORBITALS:
             raise ValueError(f'<s> should be one of {", ".join(ORBITALS)}')
 
@@ -478,7 +535,7 @@ class Element(Base):
             if sc is None:
                 return sc
             else:
-                return self.atomic_number - self.sconst.get((n, o), None)
+                return self.atomic_number - sc
         else:
             raise ValueError('<method> should be one of: "slater", "clementi"')
 
@@ -708,9 +765,13 @@ class Element(Base):
             "_series_id",
             "ec",
             "group",
+            "ionenergies",
             "ionic_radii",
             "isotopes",
+            "mass_number",
+            "oxistates",
             "screening_constants",
+            "sconst",
             "phase_transitions",
         ]
         hashable = [(k, v) for k, v in self.__dict__.items() if k not in to_drop]
@@ -727,11 +788,106 @@ class Element(Base):
         return "%s(\n%s)" % (
             self.__class__.__name__,
             " ".join(
-                "\t%s=%r,\n" % (key, getattr(self, key))
-                for key in sorted(self.__dict__.keys())
-                if not key.startswith("_")
+                "\t%s=%r,\n" % (key, self.__dict__[key])
+                for key in _repr_keys(type(self))
+                if key in self.__dict__
+            ),
+        )
+
+
+def get_elements(session: Session) -> List[Element]:
+    """
+    Fetch all the elements together with their related objects.
+
+    Every relationship is loaded with a single query for the whole batch of
+    elements instead of one query per element.
+
+    Args:
+        session: database session
+
+    Returns:
+        elements (list): list of :py:class:`Element` objects ordered by atomic number
+    """
+    query = (
+        select(Element)
+        .options(
+            selectinload(Element._ionization_energies),
+            selectinload(Element._oxidation_states),
+            selectinload(Element.ionic_radii),
+            selectinload(Element.isotopes),
+            selectinload(Element.phase_transitions),
+            selectinload(Element.screening_constants),
+            joinedload(Element._series),
+            joinedload(Element.group),
+        )
+        .order_by(Element.atomic_number)
+    )
+    return session.scalars(query).all()
+
+
+def list_elements(session: Session) -> List[Element]:
+    """
+    Fetch all the elements with only the basic columns loaded.
+
+    This is the preferred way to get the elements for overviews such as
+    rendering the periodic table. Only the atomic number, symbol, name,
+    atomic weight, group, period and electronic configuration are loaded,
+    and accessing any relationship raises
+    :py:class:`sqlalchemy.exc.InvalidRequestError`. Use
+    :py:func:`get_elements` when the related data is needed.
+
+    Args:
+        session: database session
+
+    Returns:
+        elements (list): list of :py:class:`Element` objects ordered by atomic number
+    """
+    query = (
+        select(Element)
+        .options(
+            load_only(
+                Element.atomic_number,
+                Element.symbol,
+                Element.name,
+                Element.atomic_weight,
+                Element.group_id,
+                Element.period,
+                Element.econf,
             ),
+            raiseload("*"),
         )
+        .order_by(Element.atomic_number)
+    )
+    return session.scalars(query).all()
+
+
+def load_element(session: Session, z: int, *, with_: Tuple[Any, ...] = ()) -> Element:
+    """
+    Fetch a single element loading only the explicitly requested relationships.
+
+    Accessing any relationship that was not listed in `with_` raises
+    :py:class:`sqlalchemy.exc.InvalidRequestError` instead of silently
+    emitting another query.
+
+    Args:
+        session: database session
+        z: atomic number
+        with_: relationship attributes of :py:class:`Element` to load, e.g.
+            ``(Element.isotopes, Element._ionization_energies)``
+
+    Example:
+        >>> from mendeleev.db import get_session
+        >>> from mendeleev.models import Element, load_element
+        >>> fe = load_element(get_session(), 26, with_=(Element.isotopes,))
+        >>> fe.mass_number
+        56
+    """
+    query = (
+        select(Element)
+        .where(Element.atomic_number == z)
+        .options(*[selectinload(attr) for attr in with_], raiseload("*"))
+    )
+    return session.scalars(query).one()
 
 
 def fetch_attrs_for_group(attrs: List[str], group: int = 18) -> Tuple[List[Any]]:
@@ -836,9 +992,9 @@ class IonicRadius(Base):
         return "%s(\n%s)" % (
             self.__class__.__name__,
             " ".join(
-                "\t%s=%r,\n" % (key, getattr(self, key))
-                for key in sorted(self.__dict__.keys())
-                if not key.startswith("_")
+                "\t%s=%r,\n" % (key, self.__dict__[key])
+                for key in _repr_keys(type(self))
+                if key in self.__dict__
             ),
         )
 
@@ -1004,7 +1160,7 @@ class Isotope(Base):
     spin = Column(String)
 
     element = relationship("Element", lazy="joined", back_populates="isotopes")
-    decay_modes = relationship("IsotopeDecayMode", lazy="subquery")
+    decay_modes = relationship("IsotopeDecayMode", lazy="selectin")
 
     @hybrid_property
     def is_stable(self) -> bool:
@@ -1030,6 +1186,31 @@ class Isotope(Base):
         )
 
 
+def all_exact_masses(session: Session) -> np.ndarray:
+    """
+    Compute the abundance weighted isotopic masses of all the elements at once.
+
+    Args:
+        session: database session
+
+    Returns:
+        masses (numpy.ndarray): array indexed by atomic number with the sum of
+            isotope masses weighted by their natural abundances, zero for
+            elements without naturally occurring isotopes
+    """
+    rows = session.execute(
+        select(Isotope.atomic_number, Isotope.mass, Isotope.abundance).where(
+            Isotope.abundance.isnot(None)
+        )
+    ).all()
+    z = np.fromiter((r[0] for r in rows), dtype=np.int32, count=len(rows))
+    m = np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows))
+    a = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+    zmax = session.scalar(select(func.max(Element.atomic_number)))
+    # abundances are stored in percent
+    return np.bincount(z, weights=m * a * 0.01, minlength=zmax + 1)
+
+
 class IsotopeDecayMode(Base):
     """
     IsotopeDecayMode
@@ -1,3 +1,5 @@
+import pytest
+
 from mendeleev.econf import ElectronicConfiguration
 from mendeleev import element
 
@@ -12,6 +14,14 @@ def test_parse():
         assert str(ec) == a
 
 
+def test_parse_custom_shellre():
+
+    ec = ElectronicConfiguration(
+        "1s2 2s2 2p", shellre=r"(?P<n>\d)(?P<o>[spdfghijk])(?P<e>\d+)?"
+    )
+    assert str(ec) == "1s2 2s2 2p1"
+
+
 def test_largest_core():
 
     # test for Hydrogen case (no core)
@@ -39,4 +49,66 @@ def test_nvalence():
     assert pd.nvalence() == 10
 
     th = element("Th")
-    assert th.nvalence() == 4
\ No newline at end of file
+    assert th.nvalence() == 4
+
+
+def test_slater_screening():
+
+    # nitrogen 2p: 2 * 0.85 + 4 * 0.35
+    ec = ElectronicConfiguration("1s2 2s2 2p3")
+    assert ec.slater_screening(2, "p") == pytest.approx(3.1)
+
+    # zinc 3d: 18 * 1.0 + 9 * 0.35
+    ec = ElectronicConfiguration("[Ar] 3d10 4s2")
+    assert ec.slater_screening(3, "d") == pytest.approx(21.15)
+
+
+def test_slater_screening_conf_reassigned():
+
+    ec = ElectronicConfiguration("1s2 2s2 2p3")
+    assert ec.slater_screening(2, "p") == pytest.approx(3.1)
+
+    ec.conf = "1s2 2s2 2p4"
+    assert ec.slater_screening(2, "p") == pytest.approx(3.45)
+
+
+def test_slater_screening_conf_modified_in_place():
+
+    ec = ElectronicConfiguration("1s2 2s2 2p3")
+    assert ec.slater_screening(2, "p") == pytest.approx(3.1)
+
+    ec.conf[(2, "p")] = 4
+    assert ec.slater_screening(2, "p") == pytest.approx(3.45)
+
+    ec.conf[(3, "s")] = 1
+    assert ec.slater_screening(3, "s") == pytest.approx(
+        ElectronicConfiguration("1s2 2s2 2p4 3s1").slater_screening(3, "s")
+    )
+
+
+def test_sort():
+
+    ec = ElectronicConfiguration("1s2 2s2 2p6 3s2 3p6 3d10 4s2 4p1")
+    assert str(ElectronicConfiguration(ec.sort(inplace=False))) == (
+        "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p1"
+    )
+    ec.sort()
+    assert str(ec) == "1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p1"
+    assert ec.last_subshell(wrt="aufbau") == ((4, "p"), 1)
+
+
+def test_shell2int():
+
+    ec = ElectronicConfiguration("[Ne] 3s2 3p1")
+    assert ec.shell2int()[-2:] == [(3, 0, 2), (3, 1, 1)]
+
+
+def test_max_n_conf_modified_in_place():
+
+    ec = ElectronicConfiguration("1s2 2s2 2p3")
+    assert ec.max_n() == 2
+
+    ec.conf[(3, "s")] = 1
+    assert ec.max_n() == 3
+    assert ec.max_l(3) == "s"
+    assert ec.nvalence("s", 3) == 1
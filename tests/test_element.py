@@ -1,6 +1,9 @@
 import pytest
+from sqlalchemy.exc import InvalidRequestError
+
 from mendeleev import Element, element, get_all_elements
 from mendeleev.db import get_session
+from mendeleev.models import get_elements, list_elements, load_element
 
 
 ALL_ELEMENTS = {x.symbol: x for x in get_all_elements()}
@@ -20,6 +23,63 @@ def test_query(session):
     assert si.name == "Silicon"
 
 
+def test_get_elements(session):
+
+    elements = get_elements(session)
+    assert [e.atomic_number for e in elements] == list(range(1, 119))
+    assert "isotopes" in elements[0].__dict__
+
+
+def test_list_elements(session):
+
+    elements = list_elements(session)
+    assert [e.symbol for e in elements[:3]] == ["H", "He", "Li"]
+    with pytest.raises(InvalidRequestError):
+        elements[0].isotopes
+
+
+def test_load_element(session):
+
+    fe = load_element(session, 26, with_=(Element.isotopes,))
+    assert fe.mass_number == 56
+    with pytest.raises(InvalidRequestError):
+        fe.ionenergies
+
+
+def test_econf_is_not_shared():
+
+    fe = element("Fe")
+    zeff = fe.zeff()
+    fe.ec.conf[(4, "s")] = 1
+    fe.ec.conf[(3, "d")] = 7
+    fe.ec.sort()
+
+    other = element("Fe")
+    assert other.ec is not fe.ec
+    assert str(other.ec) == "1s2 2s2 2p6 3s2 3p6 3d6 4s2"
+    assert other.zeff() == pytest.approx(zeff)
+    assert fe.zeff() != pytest.approx(zeff)
+
+
+def test_ionenergies_cached():
+
+    fe = element("Fe")
+    assert fe.ionenergies is fe.ionenergies
+    assert fe.hardness() == pytest.approx(
+        (fe.ionenergies[1] - fe.electron_affinity) * 0.5
+    )
+    assert fe.hardness(charge=1) == pytest.approx(
+        (fe.ionenergies[2] - fe.ionenergies[1]) * 0.5
+    )
+
+
+@pytest.mark.parametrize("symbol", ["H", "Fe", "Tc", "U", "Og"])
+def test_mass_number_for(session, symbol):
+
+    e = element(symbol)
+    assert Element.mass_number_for(session, e.atomic_number) == e.mass_number
+
+
 def test_element():
 
     si = element("Si")
@@ -61,6 +121,19 @@ def test_elements_repr(symbol):
     repr(e)
 
 
+def test_repr_does_not_load_relationships(session):
+
+    fe = load_element(session, 26)
+    assert "symbol='Fe'" in repr(fe)
+
+
+def test_repr_skips_unloaded_columns(session):
+
+    h = list_elements(session)[0]
+    assert "symbol='H'" in repr(h)
+    assert "block=" not in repr(h)
+
+
 @pytest.mark.parametrize("symbol", SYMBOLS)
 def test_isotopes_str(symbol):
 
@@ -1,4 +1,8 @@
+import pytest
+
 from mendeleev import isotope
+from mendeleev.db import get_session
+from mendeleev.models import all_exact_masses
 
 
 def test_get_isotope():
@@ -10,4 +14,13 @@ def test_get_isotope():
 
     result = isotope("H", 3)
     assert result.atomic_number == 1
-    assert result.mass_number == 3
\ No newline at end of file
+    assert result.mass_number == 3
+
+
+def test_all_exact_masses():
+
+    masses = all_exact_masses(get_session())
+    assert masses.shape == (119,)
+    # chlorine: 35Cl (75.8%) and 37Cl (24.2%)
+    assert masses[17] == pytest.approx(0.758 * 34.968852694 + 0.242 * 36.965902573)
+    assert masses[118] == 0.0